@@ -1,19 +1,38 @@
 """The Chiltrix CX50 integration."""
 import logging
-from datetime import timedelta
+from dataclasses import dataclass
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.device_registry import DeviceInfo
 
-from .const import DOMAIN, PLATFORMS
+from .const import (
+    CONF_ADAPTIVE_SCAN_INTERVAL,
+    DEFAULT_ADAPTIVE_SCAN_INTERVAL,
+    DOMAIN,
+    PLATFORMS,
+)
+from .coordinator import ChiltrixCoordinator
 from .modbus_client import ChiltrixModbusClient
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+@dataclass
+class ChiltrixRuntime:
+    """Per config entry runtime objects shared by the platforms."""
+
+    coordinator: ChiltrixCoordinator
+    client: ChiltrixModbusClient
+    device_info: DeviceInfo
+
+
+ChiltrixConfigEntry = ConfigEntry[ChiltrixRuntime]
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ChiltrixConfigEntry
+) -> bool:
     """Set up Chiltrix CX50 from a config entry."""
     host = entry.data["host"]
     port = entry.data.get("port", 502)
@@ -33,103 +52,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
     
     # Create data update coordinator
-    async def async_update_data():
-        """Fetch data from Chiltrix."""
-        try:
-            data = {}
-            
-            # Define all registers we need to read - based on working YAML config
-            registers_to_read = [
-                # Operating mode and setpoints (141-144)
-                141, 142, 143, 144,
-                
-                # Temperature sensors C00-C06 (200-206)
-                200, 201, 202, 203, 204, 205, 206,
-                
-                # Performance registers (209, 213-246)
-                209, 213, 214, 215, 216, 217, 218, 219, 220,
-                221, 222, 223, 224, 225, 226, 227, 228, 229, 230,
-                231, 232, 233, 234, 235, 236, 237, 238, 239, 240,
-                241, 242, 243, 244, 245, 246,
-                
-                # Electrical and system status (255-264)
-                255, 256, 257, 258, 259, 260, 261, 262, 263, 264,
-                
-                # Inlet water temp (281)
-                281,
-            ]
-            
-            # Read each register and map to named keys
-            register_map = {
-                141: "operating_mode",
-                142: "cooling_target",
-                143: "heating_target",
-                144: "dhw_target",
-                200: "c00_temp",
-                201: "c01_temp",
-                202: "ambient_temp",
-                203: "suction_temp",
-                204: "plate_exchange_temp",
-                205: "water_outlet_temp",
-                206: "c06_temp",
-                209: "compressor_current",
-                213: "pump_flow",
-                227: "compressor_frequency",
-                244: "fan_type",
-                245: "ec_fan_1_speed",
-                246: "ec_fan_2_speed",
-                255: "input_voltage",
-                256: "input_current",
-                257: "compressor_phase_current",
-                258: "bus_line_voltage",
-                259: "fan_shutdown_code",
-                260: "ipm_temp",
-                261: "compressor_run_hours",
-                262: "e_heater_power",
-                263: "din6_switch",
-                264: "din7_switch",
-                281: "inlet_water_temp",
-            }
-
-            for address in registers_to_read:
-                try:
-                    result = await client.read_holding_registers(address, 1)
-                    if result and len(result) > 0:
-                        # Store with both numeric address and named key
-                        data[address] = result[0]
-                        if address in register_map:
-                            data[register_map[address]] = result[0]
-                except Exception as err:
-                    _LOGGER.debug("Error reading register %s: %s", address, err)
-                    # Continue reading other registers even if one fails
-                    continue
-
-            if not data:
-                raise UpdateFailed("No data received from device")
-
-            return data
-            
-        except Exception as err:
-            _LOGGER.error("Error communicating with Chiltrix: %s", err)
-            raise UpdateFailed(f"Error communicating with device: {err}")
-    
-    coordinator = DataUpdateCoordinator(
+    coordinator = ChiltrixCoordinator(
         hass,
-        _LOGGER,
-        name=f"Chiltrix CX50 {host}",
-        update_method=async_update_data,
-        update_interval=timedelta(seconds=scan_interval),
+        client,
+        scan_interval,
+        adaptive=entry.data.get(
+            CONF_ADAPTIVE_SCAN_INTERVAL, DEFAULT_ADAPTIVE_SCAN_INTERVAL
+        ),
     )
     
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Fetch initial data; don't leak the persistent connection if it fails
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await client.disconnect()
+        raise
     
-    # Store coordinator and client
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {
-        "coordinator": coordinator,
-        "client": client,
-    }
+    # One DeviceInfo shared by every entity of this entry
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name="Chiltrix CX50-2 Heat Pump",
+        manufacturer="Chiltrix",
+        model="CX50-2",
+    )
+    # Store coordinator and client on the entry for the platforms
+    entry.runtime_data = ChiltrixRuntime(coordinator, client, device_info)
     
     # Forward entry setup to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -137,16 +84,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(
+    hass: HomeAssistant, entry: ChiltrixConfigEntry
+) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        # Close Modbus connection
-        client = hass.data[DOMAIN][entry.entry_id]["client"]
-        await client.disconnect()
-        
-        # Remove data
-        hass.data[DOMAIN].pop(entry.entry_id)
+        # Close Modbus connection; runtime_data is dropped with the entry
+        await entry.runtime_data.client.disconnect()
     
     return unload_ok
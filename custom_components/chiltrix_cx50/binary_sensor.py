@@ -1,139 +1,93 @@
 """Binary sensor platform for Chiltrix CX50-2."""
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
+    BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from . import ChiltrixConfigEntry
+from .entity import ChiltrixEntity
+
+BINARY_SENSORS: tuple[BinarySensorEntityDescription, ...] = (
+    BinarySensorEntityDescription(
+        key="power",
+        name="Power",
+        icon="mdi:power",
+        device_class=BinarySensorDeviceClass.RUNNING,
+    ),
+)
+
+ERROR_BINARY_SENSOR = BinarySensorEntityDescription(
+    key="error_code",
+    name="Error",
+    icon="mdi:alert-circle",
+    device_class=BinarySensorDeviceClass.PROBLEM,
+    entity_category=EntityCategory.DIAGNOSTIC,
+)
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: ChiltrixConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Chiltrix binary sensors."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-
-    entities = [
-        ChiltrixBinarySensor(
-            coordinator,
-            entry,
-            "power",
-            "Power",
-            "mdi:power",
-            BinarySensorDeviceClass.RUNNING,
-        ),
-        ChiltrixBinarySensor(
-            coordinator,
-            entry,
-            "heating_mode",
-            "Heating Mode",
-            "mdi:radiator",
-            BinarySensorDeviceClass.HEAT,
-        ),
-        ChiltrixBinarySensor(
-            coordinator,
-            entry,
-            "cooling_mode",
-            "Cooling Mode",
-            "mdi:snowflake",
-            BinarySensorDeviceClass.COLD,
-        ),
-        ChiltrixBinarySensor(
-            coordinator,
-            entry,
-            "dhw_mode_active",
-            "DHW Mode Active",
-            "mdi:water-boiler",
-            None,
-        ),
-        ChiltrixBinarySensor(
-            coordinator,
-            entry,
-            "silent_mode",
-            "Silent Mode",
-            "mdi:volume-off",
-            None,
-        ),
-        ChiltrixBinarySensor(
-            coordinator,
-            entry,
-            "defrost_active",
-            "Defrost Active",
-            "mdi:snowflake-melt",
-            None,
-        ),
-        ChiltrixBinarySensor(
-            coordinator,
-            entry,
-            "pump_enabled",
-            "Pump Enabled",
-            "mdi:water-pump",
-            BinarySensorDeviceClass.RUNNING,
-        ),
-        ChiltrixErrorBinarySensor(coordinator, entry),
+    runtime = entry.runtime_data
+    coordinator = runtime.coordinator
+    device_info = runtime.device_info
+
+    entities: list[ChiltrixBinarySensor] = [
+        ChiltrixBinarySensor(coordinator, entry, device_info, description)
+        for description in BINARY_SENSORS
     ]
+    entities.append(
+        ChiltrixErrorBinarySensor(
+            coordinator, entry, device_info, ERROR_BINARY_SENSOR
+        )
+    )
 
     async_add_entities(entities)
 
 
-class ChiltrixBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class ChiltrixBinarySensor(ChiltrixEntity, BinarySensorEntity):
     """Base Chiltrix binary sensor."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator,
         entry: ConfigEntry,
-        data_key: str,
-        name: str,
-        icon: str,
-        device_class: BinarySensorDeviceClass | None = None,
+        device_info: DeviceInfo,
+        description: BinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self._data_key = data_key
-        self._attr_name = f"Chiltrix {name}"
-        self._attr_unique_id = f"{entry.entry_id}_{data_key}"
-        self._attr_icon = icon
-        self._attr_device_class = device_class
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Chiltrix CX50-2 Heat Pump",
-            "manufacturer": "Chiltrix",
-            "model": "CX50-2",
-        }
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the binary sensor is on."""
-        return self.coordinator.data.get(self._data_key)
+        super().__init__(
+            coordinator, entry, device_info, description.key, description.name
+        )
+        self.entity_description = description
+        self._set_state_from(coordinator.data.get(description.key))
+
+    def _set_state_from(self, value: Any) -> None:
+        """Set the on state from the data value."""
+        self._attr_is_on = value
 
 
 class ChiltrixErrorBinarySensor(ChiltrixBinarySensor):
     """Error binary sensor for Chiltrix."""
 
-    def __init__(self, coordinator, entry: ConfigEntry) -> None:
-        """Initialize the error binary sensor."""
-        super().__init__(
-            coordinator,
-            entry,
-            "error_code",
-            "Error",
-            "mdi:alert-circle",
-            BinarySensorDeviceClass.PROBLEM,
-        )
-        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+    __slots__ = ()
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if there is an error."""
-        error_code = self.coordinator.data.get("error_code", 0)
-        return error_code != 0
+    def _set_state_from(self, value: Any) -> None:
+        """Set the on state when there is an error."""
+        # error_code is an integer register: both 0 and missing mean no error
+        self._attr_is_on = bool(value)
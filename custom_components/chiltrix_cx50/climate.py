@@ -10,28 +10,51 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MODE_AUTO, MODE_COOL, MODE_HEAT, MODE_OFF
+from . import ChiltrixConfigEntry
+from .const import (
+    MODE_AUTO,
+    MODE_COOL,
+    MODE_HEAT,
+    REGISTER_COOLING_TARGET,
+    REGISTER_HEATING_TARGET,
+    REGISTER_OPERATING_MODE,
+    REGISTER_POWER_CONTROL,
+)
+
+# HVAC mode <-> Chiltrix operating mode register value
+_HVAC_TO_MODE = {
+    HVACMode.HEAT: MODE_HEAT,
+    HVACMode.COOL: MODE_COOL,
+    HVACMode.AUTO: MODE_AUTO,
+}
+_MODE_TO_HVAC = {mode: hvac_mode for hvac_mode, mode in _HVAC_TO_MODE.items()}
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: ChiltrixConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Chiltrix climate entity."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    client = hass.data[DOMAIN][entry.entry_id]["client"]
+    runtime = entry.runtime_data
+    coordinator = runtime.coordinator
+    client = runtime.client
 
-    async_add_entities([ChiltrixClimate(coordinator, client, entry)])
+    async_add_entities(
+        [ChiltrixClimate(coordinator, client, entry, runtime.device_info)]
+    )
 
 
 class ChiltrixClimate(CoordinatorEntity, ClimateEntity):
     """Chiltrix climate entity."""
 
+    __slots__ = ("_client",)
+
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_supported_features = (
         ClimateEntityFeature.TARGET_TEMPERATURE
@@ -46,86 +69,82 @@ class ChiltrixClimate(CoordinatorEntity, ClimateEntity):
     ]
     _attr_min_temp = 15.0
     _attr_max_temp = 60.0
-    _attr_target_temperature_step = 0.5
-
-    def __init__(self, coordinator, client, entry: ConfigEntry) -> None:
+    # Setpoint registers 142/143 hold whole degrees Celsius, unscaled like
+    # the other registers of the verified block
+    _attr_target_temperature_step = 1.0
+
+    def __init__(
+        self,
+        coordinator,
+        client,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
         """Initialize the climate entity."""
         super().__init__(coordinator)
         self._client = client
         self._attr_name = "Chiltrix CX50-2"
         self._attr_unique_id = f"{entry.entry_id}_climate"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Chiltrix CX50-2 Heat Pump",
-            "manufacturer": "Chiltrix",
-            "model": "CX50-2",
-        }
-
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        return self.coordinator.data.get("water_outlet_temp")
-
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the target temperature."""
-        return self.coordinator.data.get("setpoint_temp")
-
-    @property
-    def hvac_mode(self) -> HVACMode:
-        """Return current HVAC mode."""
-        power = self.coordinator.data.get("power", False)
-        if not power:
-            return HVACMode.OFF
-
-        mode = self.coordinator.data.get("operation_mode", MODE_OFF)
-        
-        if mode == MODE_HEAT:
-            return HVACMode.HEAT
-        elif mode == MODE_COOL:
-            return HVACMode.COOL
-        elif mode == MODE_AUTO:
-            return HVACMode.AUTO
-        
-        return HVACMode.OFF
+        # Shared DeviceInfo built once per config entry in async_setup_entry
+        self._attr_device_info = device_info
+        self._update_from_data()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
+
+    def _update_from_data(self) -> None:
+        """Compute the entity state once per coordinator refresh.
+
+        The base class then serves the state from the _attr_* attributes
+        instead of re-reading coordinator data on every property access.
+        """
+        data = self.coordinator.data
+        mode = _MODE_TO_HVAC.get(data.get("operating_mode"), HVACMode.OFF)
+
+        self._attr_current_temperature = data.get("water_outlet_temp")
+        self._attr_target_temperature = data.get(
+            "cooling_target" if mode == HVACMode.COOL else "heating_target"
+        )
+        self._attr_hvac_mode = mode if data.get("power") else HVACMode.OFF
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
 
-        success = await self.hass.async_add_executor_job(
-            self._client.set_setpoint, temperature
+        # Writes go straight to the async client; its lock already queues
+        # them FIFO with the coordinator's polls on the one connection
+        register = (
+            REGISTER_COOLING_TARGET
+            if self.coordinator.data.get("operating_mode") == MODE_COOL
+            else REGISTER_HEATING_TARGET
         )
-        
-        if success:
-            await self.coordinator.async_request_refresh()
+        # The 1.0 step makes this exact for UI input; round() only guards
+        # service calls passing fractional degrees
+        value = round(temperature)
+        if await self._client.write_register(register, value):
+            self.coordinator.async_set_register_values({register: value})
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new HVAC mode."""
         if hvac_mode == HVACMode.OFF:
-            success = await self.hass.async_add_executor_job(
-                self._client.set_power, False
+            values = {REGISTER_POWER_CONTROL: 0}
+            success = await self._client.write_register(REGISTER_POWER_CONTROL, 0)
+        elif hvac_mode in _HVAC_TO_MODE:
+            # Power (140) and operating mode (141) are adjacent holding
+            # registers, so turn on and set the mode in a single request
+            values = {
+                REGISTER_POWER_CONTROL: 1,
+                REGISTER_OPERATING_MODE: _HVAC_TO_MODE[hvac_mode],
+            }
+            success = await self._client.write_registers(
+                REGISTER_POWER_CONTROL, list(values.values())
             )
         else:
-            # Turn on if off
-            power = self.coordinator.data.get("power", False)
-            if not power:
-                await self.hass.async_add_executor_job(self._client.set_power, True)
-
-            # Set mode
-            mode_map = {
-                HVACMode.HEAT: MODE_HEAT,
-                HVACMode.COOL: MODE_COOL,
-                HVACMode.AUTO: MODE_AUTO,
-            }
-            
-            if hvac_mode in mode_map:
-                success = await self.hass.async_add_executor_job(
-                    self._client.set_operation_mode, mode_map[hvac_mode]
-                )
-            else:
-                success = False
+            return
 
         if success:
-            await self.coordinator.async_request_refresh()
+            self.coordinator.async_set_register_values(values)
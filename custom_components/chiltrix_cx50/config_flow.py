@@ -1,6 +1,7 @@
 """Config flow for Chiltrix CX50 integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -10,59 +11,99 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL
 
-from .const import DOMAIN, CONF_SLAVE_ID, DEFAULT_PORT, DEFAULT_SLAVE_ID, DEFAULT_SCAN_INTERVAL
+from .const import (
+    DOMAIN,
+    CONF_ADAPTIVE_SCAN_INTERVAL,
+    CONF_SLAVE_ID,
+    DEFAULT_ADAPTIVE_SCAN_INTERVAL,
+    DEFAULT_PORT,
+    DEFAULT_SLAVE_ID,
+    DEFAULT_SCAN_INTERVAL,
+)
 from .modbus_client import ChiltrixModbusClient
 
 _LOGGER = logging.getLogger(__name__)
 
+# Addresses that appear in device logs as working; adjacent ones are
+# probed together as one (start, count) read
+PROBE_RANGES = (
+    (0xF3, 2),  # Operating state, error code
+    (0x100, 1),  # Power
+    (0x119, 1),  # Run hours
+)
+
+# Connection probe limits (seconds): per-request timeout, and an overall
+# budget covering the connect plus each probe read and its one retry
+PROBE_TIMEOUT = 2
+PROBE_TOTAL_TIMEOUT = PROBE_TIMEOUT + len(PROBE_RANGES) * 2 * PROBE_TIMEOUT
+
+# Validators are built once at import and shared by the schema
+_SLAVE_ID_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=0, max=247))
+_SCAN_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=5, max=300))
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
-        vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
-        vol.Optional(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): int,
-        vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
+        vol.Optional(CONF_PORT, default=DEFAULT_PORT): cv.port,
+        vol.Optional(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): _SLAVE_ID_VALIDATOR,
+        vol.Optional(
+            CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL
+        ): _SCAN_INTERVAL_VALIDATOR,
+        vol.Optional(
+            CONF_ADAPTIVE_SCAN_INTERVAL, default=DEFAULT_ADAPTIVE_SCAN_INTERVAL
+        ): bool,
     }
 )
 
 
+async def _probe_device(client: ChiltrixModbusClient) -> None:
+    """Connect and read a test register to verify communication."""
+    if not await client.connect():
+        raise CannotConnect("Failed to connect to the device")
+
+    for address, count in PROBE_RANGES:
+        test_result = await client.read_holding_registers(address=address, count=count)
+        if test_result is not None:
+            _LOGGER.info("Successfully read test register at address 0x%X", address)
+            return
+        _LOGGER.debug(
+            "Failed to read test register at address 0x%X, trying next...", address
+        )
+
+    raise CannotConnect(
+        "Connected but unable to read data from device. "
+        "Register addresses may need adjustment."
+    )
+
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
+    # Short timeout so a wrong or dead host fails the form quickly
     client = ChiltrixModbusClient(
         host=data[CONF_HOST],
         port=data[CONF_PORT],
         slave_id=data[CONF_SLAVE_ID],
+        timeout=PROBE_TIMEOUT,
     )
 
     try:
-        if not await client.connect():
-            raise CannotConnect("Failed to connect to the device")
-
-        # Try to read test registers to verify communication
-        # Try multiple addresses that appear in device logs as working
-        test_addresses = [0xF3, 0xF4, 0x100, 0x119]  # Operating state, error code, power, run hours
-        test_success = False
-        
-        for address in test_addresses:
-            test_result = await client.read_holding_registers(address=address, count=1)
-            if test_result is not None:
-                _LOGGER.info(f"Successfully read test register at address 0x{address:X}")
-                test_success = True
-                break
-            _LOGGER.debug(f"Failed to read test register at address 0x{address:X}, trying next...")
-        
-        if not test_success:
-            raise CannotConnect("Connected but unable to read data from device. Register addresses may need adjustment.")
-
-        await client.disconnect()
-
+        async with asyncio.timeout(PROBE_TOTAL_TIMEOUT):
+            await _probe_device(client)
+    except TimeoutError as err:
+        raise CannotConnect("Timed out probing the device") from err
+    except CannotConnect:
+        raise
     except Exception as err:
         _LOGGER.error("Error validating connection: %s", err)
         raise CannotConnect(f"Failed to connect: {err}") from err
+    finally:
+        await client.disconnect()
 
     # Return info that you want to store in the config entry.
     return {"title": f"Chiltrix CX50 ({data[CONF_HOST]})"}
@@ -80,6 +121,10 @@ class ChiltrixCX50ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
+            # Abort on a duplicate before opening a Modbus connection
+            await self.async_set_unique_id(user_input[CONF_HOST])
+            self._abort_if_unique_id_configured()
+
             try:
                 info = await validate_input(self.hass, user_input)
             except CannotConnect:
@@ -90,10 +135,6 @@ class ChiltrixCX50ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
-                # Check if already configured
-                await self.async_set_unique_id(user_input[CONF_HOST])
-                self._abort_if_unique_id_configured()
-
                 return self.async_create_entry(title=info["title"], data=user_input)
 
         return self.async_show_form(
@@ -1,4 +1,5 @@
 """Constants for the Chiltrix CX50 integration."""
+from homeassistant.const import Platform
 
 DOMAIN = "chiltrix_cx50"
 
@@ -8,6 +9,20 @@ DEFAULT_PORT = 502
 DEFAULT_SLAVE_ID = 1
 DEFAULT_SCAN_INTERVAL = 30
 
+# Adaptive polling: stretch the scan interval while the unit is idle
+CONF_ADAPTIVE_SCAN_INTERVAL = "adaptive_scan_interval"
+DEFAULT_ADAPTIVE_SCAN_INTERVAL = True
+ADAPTIVE_IDLE_CYCLES = 5  # Unchanged polls before backing off
+ADAPTIVE_INTERVAL_FACTOR = 4  # Idle interval = scan interval * factor
+MAX_ADAPTIVE_SCAN_INTERVAL = 300  # Upper bound for the idle interval (seconds)
+# Fast-moving keys that indicate the unit is active
+ADAPTIVE_WATCH_KEYS = (
+    "operating_mode",
+    "compressor_frequency",
+    "ec_fan_1_speed",
+    "ec_fan_2_speed",
+)
+
 # Register addresses - VERIFIED from working YAML configuration
 # Operating mode and setpoints
 REGISTER_OPERATING_MODE = 141
@@ -76,11 +91,93 @@ REGISTER_DIN7_SWITCH = 264  # C64
 # Water temperature
 REGISTER_INLET_WATER_TEMP = 281
 
-# Control registers (if needed later)
-REGISTER_POWER_CONTROL = 140
+# Control registers
+REGISTER_POWER_CONTROL = 140  # 0 = off, 1 = on; adjacent to operating mode (141)
 REGISTER_AC_HEATING_MODE = 145
 REGISTER_HOT_WATER_MODE = 146
 
+# Contiguous register ranges polled as (start, count) - one Modbus request
+# per range instead of one per register. Small gaps (207-208, 210-212) are
+# cheaper to pad than to split into extra requests.
+# Fast ranges are read every poll. Power and operating mode stay here so
+# changes made at the unit show up promptly and feed idle detection.
+FAST_RANGES = (
+    (140, 2),  # Power and operating mode (140-141)
+    (200, 10),  # Temperature sensors C00-C06 and compressor current (200-209)
+    (213, 34),  # Performance registers (213-246)
+    # Electrical sensors, IPM temperature, run hours, heater power and DIN
+    # switches (255-264); run hours ride along since one block is one request
+    (255, 10),
+    (281, 1),  # Inlet water temp (281)
+)
+# Slow ranges (setpoints) are read every SLOW_POLL_CYCLES polls
+SLOW_RANGES = (
+    (142, 3),  # Cooling, heating and DHW setpoints (142-144)
+)
+SLOW_POLL_CYCLES = 10
+# Seconds a poll may spend reading; blocks still pending after that are
+# skipped for this poll and keep their last values
+POLL_TIME_BUDGET = 10
+
+# Register address -> coordinator data key
+REGISTER_MAP = {
+    REGISTER_POWER_CONTROL: "power",
+    REGISTER_OPERATING_MODE: "operating_mode",
+    REGISTER_COOLING_TARGET: "cooling_target",
+    REGISTER_HEATING_TARGET: "heating_target",
+    REGISTER_DHW_TARGET: "dhw_target",
+    REGISTER_C00: "c00_temp",
+    REGISTER_C01: "c01_temp",
+    REGISTER_AMBIENT_TEMP: "ambient_temp",
+    REGISTER_SUCTION_TEMP: "suction_temp",
+    REGISTER_PLATE_EXCHANGE_TEMP: "plate_exchange_temp",
+    REGISTER_OUTLET_WATER_TEMP: "water_outlet_temp",
+    REGISTER_C06: "c06_temp",
+    REGISTER_COMPRESSOR_CURRENT: "compressor_current",
+    REGISTER_PUMP_FLOW: "pump_flow",
+    REGISTER_COMPRESSOR_FREQUENCY: "compressor_frequency",
+    REGISTER_FAN_TYPE: "fan_type",
+    REGISTER_EC_FAN_1_SPEED: "ec_fan_1_speed",
+    REGISTER_EC_FAN_2_SPEED: "ec_fan_2_speed",
+    REGISTER_INPUT_VOLTAGE: "input_voltage",
+    REGISTER_INPUT_CURRENT: "input_current",
+    REGISTER_COMPRESSOR_PHASE_CURRENT: "compressor_phase_current",
+    REGISTER_BUS_LINE_VOLTAGE: "bus_line_voltage",
+    REGISTER_FAN_SHUTDOWN_CODE: "fan_shutdown_code",
+    REGISTER_IPM_TEMP: "ipm_temp",
+    REGISTER_COMPRESSOR_RUN_HOURS: "compressor_run_hours",
+    REGISTER_E_HEATER_POWER: "e_heater_power",
+    REGISTER_DIN6_SWITCH: "din6_switch",
+    REGISTER_DIN7_SWITCH: "din7_switch",
+    REGISTER_INLET_WATER_TEMP: "inlet_water_temp",
+}
+
+# Temperature registers hold signed 16-bit values (sub-zero ambient/suction)
+SIGNED_REGISTERS = frozenset(
+    {
+        REGISTER_C00,
+        REGISTER_C01,
+        REGISTER_AMBIENT_TEMP,
+        REGISTER_SUCTION_TEMP,
+        REGISTER_PLATE_EXCHANGE_TEMP,
+        REGISTER_OUTLET_WATER_TEMP,
+        REGISTER_C06,
+        REGISTER_IPM_TEMP,
+        REGISTER_INLET_WATER_TEMP,
+    }
+)
+
+# Coil addresses. These come from an unverified third-party map and have
+# not been confirmed with the register scanner, so they are neither polled
+# nor written; COIL_DEFROST_MODE is a trigger, not a defrost status.
+COIL_POWER = 0  # Power on/off
+COIL_HEATING_MODE = 1  # Heating mode enable
+COIL_COOLING_MODE = 2  # Cooling mode enable
+COIL_DHW_MODE = 3  # DHW priority mode
+COIL_SILENT_MODE = 4  # Silent/quiet mode
+COIL_DEFROST_MODE = 5  # Manual defrost trigger
+COIL_PUMP_ENABLE = 6  # Pump enable/disable
+
 # Operating states
 STATE_OFF = 0
 STATE_HEATING = 1
@@ -95,6 +192,16 @@ MODE_OFF = 0
 MODE_HEAT = 1
 MODE_COOL = 2
 MODE_AUTO = 3
+MODE_DHW = 4
+
+# Mode names indexed by mode value (MODE_OFF..MODE_DHW are contiguous)
+OPERATION_MODES = ("Off", "Heating", "Cooling", "Auto", "DHW")
+
+# Fan modes
+FAN_AUTO = 0
+FAN_LOW = 1
+FAN_MEDIUM = 2
+FAN_HIGH = 3
 
 # Temperature limits (in Celsius)
 MIN_SETPOINT_TEMP = 15
@@ -113,4 +220,11 @@ MIN_FAN_SPEED = 20
 MAX_FAN_SPEED = 100
 
 # Platforms
-PLATFORMS = ["sensor", "binary_sensor", "climate", "switch", "number", "select"]
+PLATFORMS: tuple[Platform, ...] = (
+    Platform.SENSOR,
+    Platform.BINARY_SENSOR,
+    Platform.CLIMATE,
+    Platform.SWITCH,
+    Platform.NUMBER,
+    Platform.SELECT,
+)
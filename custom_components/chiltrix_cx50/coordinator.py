@@ -0,0 +1,177 @@
+"""Data update coordinator for Chiltrix CX50."""
+import logging
+from collections.abc import Mapping
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import (
+    ADAPTIVE_IDLE_CYCLES,
+    ADAPTIVE_INTERVAL_FACTOR,
+    ADAPTIVE_WATCH_KEYS,
+    FAST_RANGES,
+    MAX_ADAPTIVE_SCAN_INTERVAL,
+    POLL_TIME_BUDGET,
+    REGISTER_MAP,
+    SIGNED_REGISTERS,
+    SLOW_POLL_CYCLES,
+    SLOW_RANGES,
+)
+from .modbus_client import ChiltrixModbusClient
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# Decode plan built once at import: address -> (data key, signed). Each
+# polled value costs a single dict lookup instead of one per table.
+_DECODE_PLAN: dict[int, tuple[str | None, bool]] = {
+    address: (REGISTER_MAP.get(address), address in SIGNED_REGISTERS)
+    for address in REGISTER_MAP.keys() | SIGNED_REGISTERS
+}
+_UNMAPPED = (None, False)
+
+
+def _store_registers(data: dict[Any, Any], values: Mapping[int, int]) -> None:
+    """Store register values under both numeric address and named key."""
+    for address, value in values.items():
+        key, signed = _DECODE_PLAN.get(address, _UNMAPPED)
+        if signed:
+            # Branchless int16 sign extension; idempotent, so values that
+            # are already signed (optimistic writes) pass through unchanged
+            value = ((value + 0x8000) & 0xFFFF) - 0x8000
+        data[address] = value
+        if key is not None:
+            data[key] = value
+
+
+class ChiltrixCoordinator(DataUpdateCoordinator):
+    """Poll the Chiltrix CX50 registers and adapt the poll rate to activity."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: ChiltrixModbusClient,
+        scan_interval: int,
+        adaptive: bool = True,
+    ) -> None:
+        """Initialize the coordinator.
+
+        Args:
+            hass: Home Assistant instance
+            client: Connected Modbus client
+            scan_interval: Base poll interval in seconds
+            adaptive: Back off the poll interval while the unit is idle
+        """
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"Chiltrix CX50 {client.host}",
+            update_interval=timedelta(seconds=scan_interval),
+            # Skip notifying entities when a poll returns identical data
+            always_update=False,
+        )
+        self.client = client
+        self._base_interval = timedelta(seconds=scan_interval)
+        self._idle_interval = timedelta(
+            seconds=min(scan_interval * ADAPTIVE_INTERVAL_FACTOR, MAX_ADAPTIVE_SCAN_INTERVAL)
+        )
+        self._adaptive = adaptive
+        self._idle_cycles = 0
+        self._cycle = 0
+
+    async def _async_update_data(self) -> Mapping[Any, Any]:
+        """Fetch data from Chiltrix.
+
+        The data is handed to every entity as a read-only view, so entities
+        share one snapshot per poll and can't mutate it behind the
+        coordinator's back.
+        """
+        try:
+            data = await self._async_read_registers()
+        except UpdateFailed:
+            raise
+        except Exception as err:
+            _LOGGER.error("Error communicating with Chiltrix: %s", err)
+            raise UpdateFailed(f"Error communicating with device: {err}")
+
+        if self._adaptive:
+            self._adapt_interval(data)
+
+        return MappingProxyType(data)
+
+    async def _async_read_registers(self) -> dict[Any, Any]:
+        """Read all register ranges and map them to named keys."""
+        # Slow-moving registers (the setpoints) are only read
+        # every SLOW_POLL_CYCLES polls; in between their last values are kept.
+        read_slow = self.data is None or self._cycle % SLOW_POLL_CYCLES == 0
+        self._cycle += 1
+        register_ranges = FAST_RANGES + SLOW_RANGES if read_slow else FAST_RANGES
+
+        # Start from the last snapshot so a range that fails this poll keeps
+        # its last-known values instead of making its entities unavailable.
+        data = dict(self.data) if self.data else {}
+
+        values = await self.client.read_all_registers(
+            register_ranges, budget=POLL_TIME_BUDGET
+        )
+        _store_registers(data, values)
+
+        failed = [start for start, _count in register_ranges if start not in values]
+        if failed:
+            # One log line per poll rather than one per failed range
+            _LOGGER.debug(
+                "No data for register ranges starting at %s, keeping last values",
+                failed,
+            )
+
+        # Only fail the whole poll when every range failed
+        if not values:
+            raise UpdateFailed("No data received from device")
+
+        return data
+
+    @callback
+    def async_set_register_values(self, values: Mapping[int, int]) -> None:
+        """Publish register values that were just written to the device.
+
+        Entities update immediately instead of waiting for a re-poll; the
+        next scheduled poll reconciles them if the device rejected a write.
+        """
+        data = dict(self.data)
+        _store_registers(data, values)
+        self.async_set_updated_data(MappingProxyType(data))
+
+    @callback
+    def async_set_values(self, values: Mapping[str, Any]) -> None:
+        """Publish data-key values that were just written to the device."""
+        self.async_set_updated_data(MappingProxyType({**self.data, **values}))
+
+    def _adapt_interval(self, data: Mapping[Any, Any]) -> None:
+        """Widen the poll interval while the unit is idle, narrow it on change.
+
+        After ADAPTIVE_IDLE_CYCLES polls without any change in the
+        fast-moving registers the interval is stretched; the first change
+        drops it straight back to the configured scan interval.
+        """
+        previous = self.data
+        changed = previous is None or any(
+            data.get(key) != previous.get(key) for key in ADAPTIVE_WATCH_KEYS
+        )
+
+        if changed:
+            self._idle_cycles = 0
+            if self.update_interval != self._base_interval:
+                _LOGGER.debug("Activity detected, polling every %s", self._base_interval)
+                self.update_interval = self._base_interval
+            return
+
+        self._idle_cycles += 1
+        if (
+            self._idle_cycles >= ADAPTIVE_IDLE_CYCLES
+            and self.update_interval != self._idle_interval
+        ):
+            _LOGGER.debug("Unit idle, polling every %s", self._idle_interval)
+            self.update_interval = self._idle_interval
@@ -0,0 +1,47 @@
+"""Base entity for Chiltrix CX50-2."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+
+class ChiltrixEntity(CoordinatorEntity):
+    """Coordinator entity bound to one data key of the Chiltrix device."""
+
+    __slots__ = ("_data_key", "_last_observed")
+
+    def __init__(
+        self,
+        coordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+        data_key: str,
+        name: str,
+        unique_id_suffix: str = "",
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._data_key = data_key
+        self._attr_name = f"Chiltrix {name}"
+        self._attr_unique_id = f"{entry.entry_id}_{data_key}{unique_id_suffix}"
+        self._attr_device_info = device_info
+        # (value, available) last written; None until the first update
+        self._last_observed = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this entity's value or availability changed."""
+        value = self.coordinator.data.get(self._data_key)
+        observed = (value, self.available)
+        if observed != self._last_observed:
+            self._last_observed = observed
+            self._set_state_from(value)
+            super()._handle_coordinator_update()
+
+    def _set_state_from(self, value: Any) -> None:
+        """Set the entity's state attributes from its data value."""
+        raise NotImplementedError
@@ -1,26 +1,86 @@
 """Modbus TCP client for Chiltrix CX50."""
 import logging
 import asyncio
+import inspect
+import socket
+from collections.abc import Iterable
 from typing import Any, Optional
-try:
-    from pymodbus.client import AsyncModbusTcpClient as ModbusTcpClient
-except ImportError:
-    from pymodbus.client import ModbusTcpClient
-from pymodbus.exceptions import ModbusException
+from pymodbus.client import AsyncModbusTcpClient
+from pymodbus.exceptions import (
+    ConnectionException,
+    ModbusException,
+    ModbusIOException,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# TCP keepalive tuning so the long-lived connection survives gateway idle timeouts
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_COUNT = 3
+
+# Reconnect attempts and initial backoff delay (seconds), doubled per attempt
+RECONNECT_ATTEMPTS = 3
+RECONNECT_BACKOFF = 0.05
+
+# Pacing between transactions, only applied while the device keeps failing:
+# the delay doubles per consecutive error up to the cap and halves on success
+INTER_TX_DELAY_STEP = 0.005
+MAX_INTER_TX_DELAY = 0.1
+
+# pymodbus 3.10 renamed the unit id keyword from "slave" to "device_id"
+UNIT_ID_KWARG = (
+    "device_id"
+    if "device_id"
+    in inspect.signature(AsyncModbusTcpClient.read_holding_registers).parameters
+    else "slave"
+)
+
+# Modbus PDU limit for a single read holding registers (FC3) request
+MAX_REGISTERS_PER_READ = 125
+
+
+def _merge_ranges(ranges: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge adjacent or overlapping (start, count) ranges into runs.
+
+    Ranges separated by a gap are left apart. Whether a gap is worth padding
+    is decided where the ranges are defined (see const.FAST_RANGES), since
+    only known-readable addresses should be included.
+    """
+    runs: list[tuple[int, int]] = []
+    for start, count in sorted(ranges):
+        if runs and start <= runs[-1][0] + runs[-1][1]:
+            run_start, run_count = runs[-1]
+            runs[-1] = (run_start, max(run_count, start + count - run_start))
+        else:
+            runs.append((start, count))
+    return runs
+
 
 class ChiltrixModbusClient:
     """Modbus TCP client for Chiltrix CX50 heat pump."""
 
+    __slots__ = (
+        "host",
+        "port",
+        "slave_id",
+        "timeout",
+        "retries",
+        "client",
+        "_lock",
+        "_unit",
+        "_inter_tx_delay",
+        "_error_streak",
+        "_reconnect_task",
+    )
+
     def __init__(
         self,
         host: str,
         port: int = 502,
         slave_id: int = 1,
-        timeout: int = 5,
-        retries: int = 3,
+        timeout: float = 2,
+        retries: int = 0,
     ):
         """Initialize the Modbus client.
         
@@ -28,8 +88,9 @@ class ChiltrixModbusClient:
             host: IP address of the Modbus TCP device
             port: Modbus TCP port (default: 502)
             slave_id: Modbus slave/unit ID (default: 1)
-            timeout: Connection timeout in seconds (default: 5)
-            retries: Number of retry attempts (default: 3)
+            timeout: Request timeout in seconds (default: 2)
+            retries: pymodbus-level retries per request (default: 0); a
+                failed request is retried once by the client itself
         """
         self.host = host
         self.port = port
@@ -37,9 +98,22 @@ class ChiltrixModbusClient:
         self.timeout = timeout
         self.retries = retries
         self.client = None
+        # One Modbus transaction on the wire at a time: concurrent callers
+        # (a poll and a UI write) must not interleave on the gateway. Only
+        # pymodbus >= 3.8 serializes requests itself, and the lock also
+        # covers error pacing and the reconnect-and-retry path.
+        self._lock = asyncio.Lock()
+        # Unit id keyword resolved once and passed to every request
+        self._unit = {UNIT_ID_KWARG: slave_id}
+        self._inter_tx_delay = 0.0
+        self._error_streak = 0
+        self._reconnect_task: Optional[asyncio.Future[bool]] = None
         
         _LOGGER.info(
-            f"Initializing Modbus client for {host}:{port}, slave_id={slave_id}"
+            "Initializing Modbus client for %s:%s, slave_id=%s",
+            host,
+            port,
+            slave_id,
         )
 
     async def connect(self) -> bool:
@@ -49,39 +123,85 @@ class ChiltrixModbusClient:
             bool: True if connection successful, False otherwise
         """
         try:
-            # Close any existing connection
-            if self.client:
-                if hasattr(self.client, 'connected') and self.client.connected:
-                    _LOGGER.debug("Closing existing connection before reconnecting")
-                    close_result = self.client.close()
-                    if asyncio.iscoroutine(close_result):
-                        await close_result
-                    await asyncio.sleep(0.5)  # Give time for cleanup
-
-            # Create new client instance
-            self.client = ModbusTcpClient(
-                host=self.host,
-                port=self.port,
-                timeout=self.timeout,
-                retries=self.retries,
-            )
+            if self.client is None:
+                # Create the pymodbus client once and reuse it for every
+                # reconnect instead of rebuilding it each time
+                self.client = AsyncModbusTcpClient(
+                    host=self.host,
+                    port=self.port,
+                    timeout=self.timeout,
+                    retries=self.retries,
+                )
+            elif self.client.connected:
+                # Close the existing connection before reconnecting; close()
+                # completes before returning, so no settle delay is needed
+                _LOGGER.debug("Closing existing connection before reconnecting")
+                close_result = self.client.close()
+                if asyncio.iscoroutine(close_result):
+                    await close_result
 
-            # Connect - may be sync or async
-            result = self.client.connect()
-            if asyncio.iscoroutine(result):
-                result = await result
+            result = await self.client.connect()
 
             if result:
-                _LOGGER.info(f"Successfully connected to {self.host}:{self.port}")
+                self._configure_socket()
+                _LOGGER.info("Successfully connected to %s:%s", self.host, self.port)
             else:
-                _LOGGER.error(f"Failed to connect to {self.host}:{self.port}")
+                _LOGGER.error("Failed to connect to %s:%s", self.host, self.port)
 
             return result
 
+        except (ConnectionException, asyncio.TimeoutError, OSError) as e:
+            _LOGGER.warning("Unable to connect to %s:%s: %s", self.host, self.port, e)
+            return False
         except Exception as e:
-            _LOGGER.error(f"Connection error: {e}", exc_info=True)
+            _LOGGER.error("Connection error: %s", e, exc_info=True)
             return False
 
+    def _get_socket(self) -> Optional[socket.socket]:
+        """Return the underlying TCP socket of the pymodbus client, if any."""
+        sock = getattr(self.client, "socket", None)
+        if isinstance(sock, socket.socket):
+            return sock
+
+        # Async clients expose an asyncio transport instead of a raw socket
+        transport = getattr(self.client, "transport", None)
+        if transport is None:
+            protocol = getattr(self.client, "protocol", None)
+            transport = getattr(protocol, "transport", None)
+        if transport is None:
+            # pymodbus 3.7+ keeps the transport on the client's ctx
+            ctx = getattr(self.client, "ctx", None)
+            transport = getattr(ctx, "transport", None)
+        if transport is None:
+            return None
+        return transport.get_extra_info("socket")
+
+    def _configure_socket(self) -> None:
+        """Disable Nagle's algorithm and enable TCP keepalive on the socket.
+
+        Modbus polling is small request/response frames, so Nagle combined with
+        delayed ACKs on the gateway adds tens of milliseconds to every read.
+        """
+        sock = self._get_socket()
+        if sock is None:
+            _LOGGER.debug("No socket available to configure TCP options")
+            return
+
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Keepalive timings are platform specific
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE)
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                sock.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL
+                )
+            if hasattr(socket, "TCP_KEEPCNT"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, KEEPALIVE_COUNT)
+        except OSError as e:
+            _LOGGER.debug("Unable to set TCP socket options: %s", e)
+
     async def disconnect(self):
         """Disconnect from the Modbus device."""
         try:
@@ -91,15 +211,38 @@ class ChiltrixModbusClient:
                     await close_result
                 _LOGGER.info("Disconnected from Modbus device")
         except Exception as e:
-            _LOGGER.debug(f"Error during disconnect: {e}")
+            _LOGGER.debug("Error during disconnect: %s", e)
 
-    def close(self):
-        """Synchronous close method for compatibility."""
-        try:
-            if self.client:
-                self.client.close()
-        except Exception as e:
-            _LOGGER.debug(f"Error closing connection: {e}")
+    async def _ensure_connected(self) -> bool:
+        """Make sure the persistent connection is open, reconnecting if needed.
+
+        The connection is kept open across polls; it is only re-established
+        when it has dropped. Requests issued together (one poll's blocks)
+        share a single reconnect attempt instead of each running their own.
+
+        Returns:
+            bool: True if connected, False otherwise
+        """
+        if self.is_connected:
+            return True
+
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.ensure_future(self._reconnect())
+        # Shielded so one caller giving up doesn't cancel it for the others
+        return await asyncio.shield(self._reconnect_task)
+
+    async def _reconnect(self) -> bool:
+        """Reconnect with exponential backoff between attempts."""
+        _LOGGER.warning("Not connected, attempting to reconnect...")
+        delay = RECONNECT_BACKOFF
+        for attempt in range(RECONNECT_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(delay)
+                delay *= 2
+            if await self.connect():
+                return True
+
+        return False
 
     @property
     def is_connected(self) -> bool:
@@ -110,6 +253,57 @@ class ChiltrixModbusClient:
         """
         return self.client is not None and self.client.connected
 
+    async def _transact(self, request, address: int, **kwargs: Any) -> Any:
+        """Run one Modbus request under the transaction lock.
+
+        No delay is inserted between requests while the device answers;
+        consecutive errors add a growing gap so a struggling gateway gets
+        time to recover.
+        """
+        async with self._lock:
+            if self._inter_tx_delay:
+                await asyncio.sleep(self._inter_tx_delay)
+            try:
+                result = await self._request_with_reconnect(request, address, kwargs)
+            except Exception:
+                self._record_result(False)
+                raise
+
+        self._record_result(not result.isError())
+        return result
+
+    async def _request_with_reconnect(
+        self, request, address: int, kwargs: dict[str, Any]
+    ) -> Any:
+        """Send a request, reopening the connection and retrying once.
+
+        A socket that died since the last poll, or a request that got no
+        response, only shows up when a request is sent; reconnecting here
+        keeps the poll from failing outright. This is the only retry layer:
+        pymodbus itself is configured with no retries by default.
+        """
+        try:
+            return await request(address, **kwargs, **self._unit)
+        except (ConnectionException, ModbusIOException) as e:
+            _LOGGER.debug("Connection lost (%s), reconnecting and retrying", e)
+            if not await self.connect():
+                raise
+            return await request(address, **kwargs, **self._unit)
+
+    def _record_result(self, ok: bool) -> None:
+        """Adapt the inter-transaction delay to the latest outcome."""
+        if ok:
+            self._error_streak = 0
+            self._inter_tx_delay /= 2
+            if self._inter_tx_delay < INTER_TX_DELAY_STEP:
+                self._inter_tx_delay = 0.0
+            return
+
+        self._error_streak += 1
+        self._inter_tx_delay = min(
+            MAX_INTER_TX_DELAY, INTER_TX_DELAY_STEP * 2**self._error_streak
+        )
+
     async def read_holding_registers(
         self, address: int, count: int = 1
     ) -> Optional[list[int]]:
@@ -122,39 +316,140 @@ class ChiltrixModbusClient:
         Returns:
             list[int]: Register values, or None if error
         """
-        if not self.is_connected:
-            _LOGGER.warning("Not connected, attempting to reconnect...")
-            if not await self.connect():
-                return None
+        if not await self._ensure_connected():
+            return None
 
         try:
-            # Call the method directly - it may return a coroutine or a result
-            result = self.client.read_holding_registers(address, count=count)
-
-            # If it's a coroutine, await it
-            if asyncio.iscoroutine(result):
-                result = await result
+            result = await self._transact(
+                self.client.read_holding_registers, address, count=count
+            )
 
             if result.isError():
                 # Log detailed error information
-                error_details = f"Function code: {getattr(result, 'function_code', 'N/A')}, "
-                error_details += f"Exception code: {getattr(result, 'exception_code', 'N/A')}"
                 _LOGGER.error(
-                    f"Error reading registers at address 0x{address:X} ({address}): {error_details}"
+                    "Error reading registers at address 0x%X (%s): "
+                    "Function code: %s, Exception code: %s",
+                    address,
+                    address,
+                    getattr(result, "function_code", "N/A"),
+                    getattr(result, "exception_code", "N/A"),
                 )
                 return None
 
             return result.registers
 
+        except (ConnectionException, asyncio.TimeoutError, OSError) as e:
+            _LOGGER.warning("Modbus I/O error at address %s: %s", address, e)
+            return None
         except ModbusException as e:
-            _LOGGER.error(f"Modbus exception reading address {address}: {e}")
+            _LOGGER.error("Modbus exception reading address %s: %s", address, e)
             return None
         except Exception as e:
             _LOGGER.error(
-                f"Unexpected error reading address {address}: {e}", exc_info=True
+                "Unexpected error reading address %s: %s",
+                address,
+                e,
+                exc_info=True,
             )
             return None
 
+    async def read_all_registers(
+        self,
+        ranges: Iterable[tuple[int, int]],
+        budget: Optional[float] = None,
+    ) -> dict[int, int]:
+        """Read several contiguous register ranges.
+
+        Adjacent or overlapping ranges are merged first, then each run is
+        fetched with block reads of at most MAX_REGISTERS_PER_READ registers
+        instead of one request per register. The reads are independent and
+        queued together; the transaction lock sends them back to back on the
+        connection. A failed block that merged several ranges is re-read as
+        those ranges, so one unreadable address only costs its own range.
+
+        Args:
+            ranges: (start address, count) pairs to read
+            budget: Seconds to wait for all blocks; blocks still pending
+                after that are cancelled and left out (default: no limit)
+
+        Returns:
+            dict[int, int]: Register values by address; addresses of ranges
+            that failed or ran over the budget are missing
+        """
+        ranges = list(ranges)
+        blocks = [
+            (block_start, min(MAX_REGISTERS_PER_READ, start + count - block_start))
+            for start, count in _merge_ranges(ranges)
+            for block_start in range(start, start + count, MAX_REGISTERS_PER_READ)
+        ]
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await self._read_blocks(blocks, budget)
+
+        values: dict[int, int] = {}
+        fallback: list[tuple[int, int]] = []
+        for (start, count), result in zip(blocks, results):
+            if result:
+                for offset, value in enumerate(result):
+                    values[start + offset] = value
+                continue
+            # Fall back to the requested ranges inside the failed block,
+            # clipped to it; a block that is a single range is not retried
+            end = start + count
+            parts = [
+                (max(s, start), min(s + c, end) - max(s, start))
+                for s, c in ranges
+                if s < end and s + c > start
+            ]
+            if parts != [(start, count)]:
+                fallback.extend(parts)
+
+        remaining = None if budget is None else budget - (loop.time() - started)
+        if fallback and (remaining is None or remaining > 0):
+            results = await self._read_blocks(fallback, remaining)
+            for (start, _count), result in zip(fallback, results):
+                if result:
+                    for offset, value in enumerate(result):
+                        values[start + offset] = value
+
+        return values
+
+    async def _read_blocks(
+        self,
+        blocks: list[tuple[int, int]],
+        budget: Optional[float],
+    ) -> list[Optional[list[int]]]:
+        """Read (start, count) blocks concurrently within the budget.
+
+        Returns:
+            list: One result per block, None for blocks that failed or were
+            cancelled at the budget
+        """
+        tasks = [
+            asyncio.ensure_future(self.read_holding_registers(start, count))
+            for start, count in blocks
+        ]
+        _done, pending = await asyncio.wait(tasks, timeout=budget)
+        if pending:
+            # Partial results beat stalling the whole update on a slow device
+            _LOGGER.debug(
+                "Read budget of %ss exceeded, skipping %s of %s blocks",
+                budget,
+                len(pending),
+                len(tasks),
+            )
+            for task in pending:
+                task.cancel()
+            # Let the cancellations land so every task is done before its
+            # outcome is inspected below
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return [
+            None if task.cancelled() or task.exception() is not None else task.result()
+            for task in tasks
+        ]
+
     async def write_register(self, address: int, value: int) -> bool:
         """Write a single register to the device.
         
@@ -165,32 +460,37 @@ class ChiltrixModbusClient:
         Returns:
             bool: True if successful, False otherwise
         """
-        if not self.is_connected:
-            _LOGGER.warning("Not connected, attempting to reconnect...")
-            if not await self.connect():
-                return False
+        if not await self._ensure_connected():
+            return False
 
         try:
-            # Call the method directly - it may return a coroutine or a result
-            result = self.client.write_register(address, value=value)
-
-            # If it's a coroutine, await it
-            if asyncio.iscoroutine(result):
-                result = await result
+            result = await self._transact(
+                self.client.write_register, address, value=value
+            )
 
             if result.isError():
-                _LOGGER.error(f"Error writing register at address {address}: {result}")
+                _LOGGER.error(
+                    "Error writing register at address %s: %s",
+                    address,
+                    result,
+                )
                 return False
 
-            _LOGGER.debug(f"Successfully wrote {value} to register {address}")
+            _LOGGER.debug("Successfully wrote %s to register %s", value, address)
             return True
 
+        except (ConnectionException, asyncio.TimeoutError, OSError) as e:
+            _LOGGER.warning("Modbus I/O error at address %s: %s", address, e)
+            return False
         except ModbusException as e:
-            _LOGGER.error(f"Modbus exception writing address {address}: {e}")
+            _LOGGER.error("Modbus exception writing address %s: %s", address, e)
             return False
         except Exception as e:
             _LOGGER.error(
-                f"Unexpected error writing address {address}: {e}", exc_info=True
+                "Unexpected error writing address %s: %s",
+                address,
+                e,
+                exc_info=True,
             )
             return False
 
@@ -204,36 +504,41 @@ class ChiltrixModbusClient:
         Returns:
             bool: True if successful, False otherwise
         """
-        if not self.is_connected:
-            _LOGGER.warning("Not connected, attempting to reconnect...")
-            if not await self.connect():
-                return False
+        if not await self._ensure_connected():
+            return False
 
         try:
-            # Call the method directly - it may return a coroutine or a result
-            result = self.client.write_registers(address, values=values)
-
-            # If it's a coroutine, await it
-            if asyncio.iscoroutine(result):
-                result = await result
+            result = await self._transact(
+                self.client.write_registers, address, values=values
+            )
 
             if result.isError():
                 _LOGGER.error(
-                    f"Error writing registers at address {address}: {result}"
+                    "Error writing registers at address %s: %s",
+                    address,
+                    result,
                 )
                 return False
 
             _LOGGER.debug(
-                f"Successfully wrote {len(values)} registers starting at {address}"
+                "Successfully wrote %s registers starting at %s",
+                len(values),
+                address,
             )
             return True
 
+        except (ConnectionException, asyncio.TimeoutError, OSError) as e:
+            _LOGGER.warning("Modbus I/O error at address %s: %s", address, e)
+            return False
         except ModbusException as e:
-            _LOGGER.error(f"Modbus exception writing address {address}: {e}")
+            _LOGGER.error("Modbus exception writing address %s: %s", address, e)
             return False
         except Exception as e:
             _LOGGER.error(
-                f"Unexpected error writing address {address}: {e}", exc_info=True
+                "Unexpected error writing address %s: %s",
+                address,
+                e,
+                exc_info=True,
             )
             return False
 
@@ -247,31 +552,35 @@ class ChiltrixModbusClient:
         Returns:
             list[bool]: Coil values, or None if error
         """
-        if not self.is_connected:
-            _LOGGER.warning("Not connected, attempting to reconnect...")
-            if not await self.connect():
-                return None
+        if not await self._ensure_connected():
+            return None
 
         try:
-            # Call the method directly - it may return a coroutine or a result
-            result = self.client.read_coils(address, count=count)
-
-            # If it's a coroutine, await it
-            if asyncio.iscoroutine(result):
-                result = await result
+            result = await self._transact(
+                self.client.read_coils, address, count=count
+            )
 
             if result.isError():
-                _LOGGER.error(f"Error reading coils at address {address}: {result}")
+                _LOGGER.error("Error reading coils at address %s: %s", address, result)
                 return None
 
             return result.bits[:count]
 
+        except (ConnectionException, asyncio.TimeoutError, OSError) as e:
+            _LOGGER.warning("Modbus I/O error at address %s: %s", address, e)
+            return None
         except ModbusException as e:
-            _LOGGER.error(f"Modbus exception reading coils at address {address}: {e}")
+            _LOGGER.error(
+                "Modbus exception reading coils at address %s: %s",
+                address,
+                e,
+            )
             return None
         except Exception as e:
             _LOGGER.error(
-                f"Unexpected error reading coils at address {address}: {e}",
+                "Unexpected error reading coils at address %s: %s",
+                address,
+                e,
                 exc_info=True,
             )
             return None
@@ -286,32 +595,32 @@ class ChiltrixModbusClient:
         Returns:
             bool: True if successful, False otherwise
         """
-        if not self.is_connected:
-            _LOGGER.warning("Not connected, attempting to reconnect...")
-            if not await self.connect():
-                return False
+        if not await self._ensure_connected():
+            return False
 
         try:
-            # Call the method directly - it may return a coroutine or a result
-            result = self.client.write_coil(address, value=value)
-
-            # If it's a coroutine, await it
-            if asyncio.iscoroutine(result):
-                result = await result
+            result = await self._transact(
+                self.client.write_coil, address, value=value
+            )
 
             if result.isError():
-                _LOGGER.error(f"Error writing coil at address {address}: {result}")
+                _LOGGER.error("Error writing coil at address %s: %s", address, result)
                 return False
 
-            _LOGGER.debug(f"Successfully wrote {value} to coil {address}")
+            _LOGGER.debug("Successfully wrote %s to coil %s", value, address)
             return True
 
+        except (ConnectionException, asyncio.TimeoutError, OSError) as e:
+            _LOGGER.warning("Modbus I/O error at address %s: %s", address, e)
+            return False
         except ModbusException as e:
-            _LOGGER.error(f"Modbus exception writing coil at address {address}: {e}")
+            _LOGGER.error("Modbus exception writing coil at address %s: %s", address, e)
             return False
         except Exception as e:
             _LOGGER.error(
-                f"Unexpected error writing coil at address {address}: {e}",
+                "Unexpected error writing coil at address %s: %s",
+                address,
+                e,
                 exc_info=True,
             )
             return False
@@ -1,274 +1,109 @@
 """Number platform for Chiltrix CX50-2."""
 from __future__ import annotations
 
-from homeassistant.components.number import NumberEntity
+from dataclasses import dataclass
+
+from homeassistant.components.number import NumberEntity, NumberEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, UnitOfTemperature
+from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, TEMP_SCALE
+from . import ChiltrixConfigEntry
+from .const import MAX_DHW_SETPOINT, MIN_DHW_SETPOINT, REGISTER_DHW_TARGET
+from .entity import ChiltrixEntity
+
+
+@dataclass(frozen=True, kw_only=True)
+class ChiltrixNumberEntityDescription(NumberEntityDescription):
+    """Number description with the holding register it writes.
+
+    Only verified registers get an entity; the other configuration values
+    (outlet limits, antifreeze, pump speeds) are left out until their CX50
+    addresses are confirmed.
+    """
+
+    register_address: int
+
+
+NUMBERS: tuple[ChiltrixNumberEntityDescription, ...] = (
+    ChiltrixNumberEntityDescription(
+        key="dhw_target",
+        name="DHW Setpoint",
+        icon="mdi:water-boiler",
+        native_min_value=MIN_DHW_SETPOINT,
+        native_max_value=MAX_DHW_SETPOINT,
+        # 144 holds whole degrees, like the climate setpoints 142/143
+        native_step=1.0,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        register_address=REGISTER_DHW_TARGET,
+    ),
+)
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: ChiltrixConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Chiltrix number entities."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    client = hass.data[DOMAIN][entry.entry_id]["client"]
+    runtime = entry.runtime_data
+    coordinator = runtime.coordinator
+    client = runtime.client
+    device_info = runtime.device_info
 
-    entities = [
-        ChiltrixTemperatureNumber(
-            coordinator,
-            client,
-            entry,
-            "setpoint_temp",
-            "Setpoint Temperature",
-            "mdi:thermometer-auto",
-            15.0,
-            60.0,
-            0.5,
-            "REGISTER_SETPOINT_TEMP",
-        ),
-        ChiltrixTemperatureNumber(
-            coordinator,
-            client,
-            entry,
-            "dhw_setpoint",
-            "DHW Setpoint",
-            "mdi:water-boiler",
-            35.0,
-            65.0,
-            0.5,
-            "REGISTER_DHW_SETPOINT",
-        ),
-        ChiltrixTemperatureNumber(
-            coordinator,
-            client,
-            entry,
-            "max_outlet_temp",
-            "Max Outlet Temperature",
-            "mdi:thermometer-high",
-            20.0,
-            65.0,
-            0.5,
-            "REGISTER_MAX_OUTLET_TEMP",
-            EntityCategory.CONFIG,
-        ),
-        ChiltrixTemperatureNumber(
-            coordinator,
-            client,
-            entry,
-            "min_outlet_temp",
-            "Min Outlet Temperature",
-            "mdi:thermometer-low",
-            10.0,
-            40.0,
-            0.5,
-            "REGISTER_MIN_OUTLET_TEMP",
-            EntityCategory.CONFIG,
-        ),
-        ChiltrixTemperatureNumber(
-            coordinator,
-            client,
-            entry,
-            "antifreeze_temp",
-            "Antifreeze Temperature",
-            "mdi:snowflake-alert",
-            -10.0,
-            10.0,
-            0.5,
-            "REGISTER_ANTIFREEZE_TEMP",
-            EntityCategory.CONFIG,
-        ),
-        ChiltrixPercentageNumber(
-            coordinator,
-            client,
-            entry,
-            "min_pump_speed",
-            "Min Pump Speed",
-            "mdi:water-pump",
-            20,
-            100,
-            5,
-            "REGISTER_MIN_PUMP_SPEED",
-            EntityCategory.CONFIG,
-        ),
-        ChiltrixPercentageNumber(
-            coordinator,
-            client,
-            entry,
-            "max_pump_speed",
-            "Max Pump Speed",
-            "mdi:water-pump",
-            30,
-            100,
-            5,
-            "REGISTER_MAX_PUMP_SPEED",
-            EntityCategory.CONFIG,
-        ),
-    ]
+    async_add_entities(
+        ChiltrixNumber(coordinator, client, entry, device_info, description)
+        for description in NUMBERS
+    )
 
-    async_add_entities(entities)
 
+class ChiltrixNumber(ChiltrixEntity, NumberEntity):
+    """Chiltrix number entity backed by a holding register."""
 
-class ChiltrixNumber(CoordinatorEntity, NumberEntity):
-    """Base Chiltrix number entity."""
+    __slots__ = (
+        "_client",
+        "_register_address",
+    )
 
     def __init__(
         self,
         coordinator,
         client,
         entry: ConfigEntry,
-        data_key: str,
-        name: str,
-        icon: str,
-        min_value: float,
-        max_value: float,
-        step: float,
-        register_name: str,
-        entity_category: EntityCategory | None = None,
+        device_info: DeviceInfo,
+        description: ChiltrixNumberEntityDescription,
     ) -> None:
         """Initialize the number entity."""
-        super().__init__(coordinator)
-        self._client = client
-        self._data_key = data_key
-        self._register_name = register_name
-        self._attr_name = f"Chiltrix {name}"
-        self._attr_unique_id = f"{entry.entry_id}_{data_key}_number"
-        self._attr_icon = icon
-        self._attr_native_min_value = min_value
-        self._attr_native_max_value = max_value
-        self._attr_native_step = step
-        self._attr_entity_category = entity_category
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Chiltrix CX50-2 Heat Pump",
-            "manufacturer": "Chiltrix",
-            "model": "CX50-2",
-        }
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value."""
-        return self.coordinator.data.get(self._data_key)
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Set new value."""
-        # This will be overridden in subclasses
-        pass
-
-
-class ChiltrixTemperatureNumber(ChiltrixNumber):
-    """Temperature number entity for Chiltrix."""
-
-    def __init__(
-        self,
-        coordinator,
-        client,
-        entry: ConfigEntry,
-        data_key: str,
-        name: str,
-        icon: str,
-        min_value: float,
-        max_value: float,
-        step: float,
-        register_name: str,
-        entity_category: EntityCategory | None = None,
-    ) -> None:
-        """Initialize the temperature number entity."""
         super().__init__(
             coordinator,
-            client,
             entry,
-            data_key,
-            name,
-            icon,
-            min_value,
-            max_value,
-            step,
-            register_name,
-            entity_category,
+            device_info,
+            description.key,
+            description.name,
+            "_number",
         )
-        self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Set new temperature value."""
-        # Import the register address from const
-        from .const import REGISTER_SETPOINT_TEMP, REGISTER_DHW_SETPOINT, REGISTER_MAX_OUTLET_TEMP, REGISTER_MIN_OUTLET_TEMP, REGISTER_ANTIFREEZE_TEMP
-        
-        register_map = {
-            "REGISTER_SETPOINT_TEMP": REGISTER_SETPOINT_TEMP,
-            "REGISTER_DHW_SETPOINT": REGISTER_DHW_SETPOINT,
-            "REGISTER_MAX_OUTLET_TEMP": REGISTER_MAX_OUTLET_TEMP,
-            "REGISTER_MIN_OUTLET_TEMP": REGISTER_MIN_OUTLET_TEMP,
-            "REGISTER_ANTIFREEZE_TEMP": REGISTER_ANTIFREEZE_TEMP,
-        }
-        
-        register_address = register_map.get(self._register_name)
-        if register_address is not None:
-            int_value = int(value * TEMP_SCALE)
-            success = await self.hass.async_add_executor_job(
-                self._client.write_holding_register, register_address, int_value
-            )
-            
-            if success:
-                await self.coordinator.async_request_refresh()
-
+        self.entity_description = description
+        self._client = client
+        self._register_address = description.register_address
+        self._set_state_from(coordinator.data.get(description.key))
 
-class ChiltrixPercentageNumber(ChiltrixNumber):
-    """Percentage number entity for Chiltrix."""
-
-    def __init__(
-        self,
-        coordinator,
-        client,
-        entry: ConfigEntry,
-        data_key: str,
-        name: str,
-        icon: str,
-        min_value: float,
-        max_value: float,
-        step: float,
-        register_name: str,
-        entity_category: EntityCategory | None = None,
-    ) -> None:
-        """Initialize the percentage number entity."""
-        super().__init__(
-            coordinator,
-            client,
-            entry,
-            data_key,
-            name,
-            icon,
-            min_value,
-            max_value,
-            step,
-            register_name,
-            entity_category,
-        )
-        self._attr_native_unit_of_measurement = PERCENTAGE
+    def _set_state_from(self, value: float | None) -> None:
+        """Set the native value from the register value."""
+        self._attr_native_value = value
 
     async def async_set_native_value(self, value: float) -> None:
-        """Set new percentage value."""
-        # Import the register address from const
-        from .const import REGISTER_MIN_PUMP_SPEED, REGISTER_MAX_PUMP_SPEED
-        
-        register_map = {
-            "REGISTER_MIN_PUMP_SPEED": REGISTER_MIN_PUMP_SPEED,
-            "REGISTER_MAX_PUMP_SPEED": REGISTER_MAX_PUMP_SPEED,
-        }
-        
-        register_address = register_map.get(self._register_name)
-        if register_address is not None:
-            int_value = int(value)
-            success = await self.hass.async_add_executor_job(
-                self._client.write_holding_register, register_address, int_value
+        """Set new value."""
+        # Re-asserting the current value (e.g. from an automation) needs no write
+        current = self._attr_native_value
+        if current is not None and abs(current - value) < self.native_step / 2:
+            return
+
+        # The 1.0 step makes this exact for UI input; round() only guards
+        # service calls passing fractional degrees
+        int_value = round(value)
+        if await self._client.write_register(self._register_address, int_value):
+            self.coordinator.async_set_register_values(
+                {self._register_address: int_value}
             )
-            
-            if success:
-                await self.coordinator.async_request_refresh()
@@ -13,15 +13,77 @@ Example:
 
 import sys
 import asyncio
-from pymodbus.client import ModbusTcpClient
+import inspect
+from pymodbus.client import AsyncModbusTcpClient
+
+# pymodbus 3.10 renamed the unit id keyword from "slave" to "device_id"
+UNIT_ID_KWARG = (
+    "device_id"
+    if "device_id"
+    in inspect.signature(AsyncModbusTcpClient.read_holding_registers).parameters
+    else "slave"
+)
+
+# Modbus caps a holding register read at 125 registers
+MAX_REGISTERS_PER_READ = 125
+# Ranges separated by at most this many registers are read as one block
+MAX_MERGE_GAP = 30
+
+def coalesce_ranges(scan_ranges):
+    """Group near-adjacent (start, end, description) ranges into bulk reads.
+
+    Returns (start, end, indexes) blocks, where indexes are the positions in
+    scan_ranges covered by the block.
+    """
+    blocks = []
+    for index, (start, end, _) in sorted(
+        enumerate(scan_ranges), key=lambda item: item[1][0]
+    ):
+        if blocks:
+            block_start, block_end, indexes = blocks[-1]
+            merged_end = max(block_end, end)
+            if (
+                start - block_end - 1 <= MAX_MERGE_GAP
+                and merged_end - block_start + 1 <= MAX_REGISTERS_PER_READ
+            ):
+                blocks[-1] = (block_start, merged_end, indexes + [index])
+                continue
+        blocks.append((start, end, [index]))
+    return blocks
+
+async def scan_addresses(client, start, end, slave_id):
+    """Probe each address in a range individually and return the working ones."""
+    working_registers = []
+    
+    for address in range(start, end + 1):
+        try:
+            result = await client.read_holding_registers(
+                address, count=1, **{UNIT_ID_KWARG: slave_id}
+            )
+            
+            if not result.isError():
+                value = result.registers[0]
+                print(f"✓ 0x{address:03X} ({address:3d}): {value:5d} (0x{value:04X})")
+                working_registers.append((address, value))
+            else:
+                error_code = getattr(result, 'exception_code', '?')
+                print(f"✗ 0x{address:03X} ({address:3d}): Error (exception code: {error_code})")
+                
+        except Exception as e:
+            print(f"✗ 0x{address:03X} ({address:3d}): Exception - {e}")
+        
+        # Small delay to avoid overwhelming the device
+        await asyncio.sleep(0.1)
+    
+    return working_registers
 
 async def scan_registers(host, port=502, slave_id=1):
     """Scan common register ranges to find working addresses."""
     
     print(f"Connecting to {host}:{port} (slave_id={slave_id})...")
-    client = ModbusTcpClient(host=host, port=port, timeout=5)
+    client = AsyncModbusTcpClient(host=host, port=port, timeout=5)
     
-    if not client.connect():
+    if not await client.connect():
         print("ERROR: Failed to connect!")
         return
     
@@ -39,29 +101,64 @@ async def scan_registers(host, port=502, slave_id=1):
     
     working_registers = []
     
-    for start, end, description in scan_ranges:
+    # Read near-adjacent ranges as one padded block. Blocks are awaited one
+    # after another: pymodbus only serializes concurrent requests on a
+    # client from 3.8 on, and older releases are still supported.
+    blocks = coalesce_ranges(scan_ranges)
+    results = []
+    for start, end, _ in blocks:
+        try:
+            results.append(
+                await client.read_holding_registers(
+                    start, count=end - start + 1, **{UNIT_ID_KWARG: slave_id}
+                )
+            )
+        except Exception as e:
+            results.append(e)
+    
+    # Slice each successful block back into the ranges it covers; ranges of
+    # a rejected block stay None and are read on their own below
+    range_values = [None] * len(scan_ranges)
+    for (block_start, _, indexes), result in zip(blocks, results):
+        if isinstance(result, Exception) or result.isError():
+            continue
+        for index in indexes:
+            start, end, _ = scan_ranges[index]
+            range_values[index] = result.registers[
+                start - block_start : end - block_start + 1
+            ]
+    
+    for (start, end, description), values in zip(scan_ranges, range_values):
         print(f"\nScanning {description} (0x{start:X}-0x{end:X}):")
         print("-" * 80)
         
-        for address in range(start, end + 1):
+        if values is None:
             try:
-                result = client.read_holding_registers(address, 1, slave_id)
-                
-                if not result.isError():
-                    value = result.registers[0]
-                    print(f"✓ 0x{address:03X} ({address:3d}): {value:5d} (0x{value:04X})")
-                    working_registers.append((address, value))
-                else:
-                    error_code = getattr(result, 'exception_code', '?')
-                    print(f"✗ 0x{address:03X} ({address:3d}): Error (exception code: {error_code})")
-                    
+                result = await client.read_holding_registers(
+                    start, count=end - start + 1, **{UNIT_ID_KWARG: slave_id}
+                )
             except Exception as e:
-                print(f"✗ 0x{address:03X} ({address:3d}): Exception - {e}")
+                result = e
             
-            # Small delay to avoid overwhelming the device
-            await asyncio.sleep(0.1)
+            # Only probe address by address when the device rejects the block
+            # (e.g. it contains unmapped registers)
+            if isinstance(result, Exception):
+                print(f"Block read failed ({result}), probing registers one at a time...")
+                working_registers.extend(await scan_addresses(client, start, end, slave_id))
+                continue
+            if result.isError():
+                print("Block read rejected, probing registers one at a time...")
+                working_registers.extend(await scan_addresses(client, start, end, slave_id))
+                continue
+            values = result.registers
+        
+        for address, value in zip(range(start, end + 1), values):
+            print(f"✓ 0x{address:03X} ({address:3d}): {value:5d} (0x{value:04X})")
+            working_registers.append((address, value))
     
-    client.close()
+    close_result = client.close()
+    if asyncio.iscoroutine(close_result):
+        await close_result
     
     # Summary
     print("\n" + "=" * 80)
@@ -1,9 +1,13 @@
 """Sensor platform for Chiltrix CX50-2."""
 from __future__ import annotations
 
+from collections.abc import Iterator
+from dataclasses import dataclass
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -17,230 +21,215 @@ from homeassistant.const import (
     UnitOfVolumeFlowRate,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from . import ChiltrixConfigEntry
+from .entity import ChiltrixEntity
+
+# Thermal power (W) per raw flow unit per kelvin: flow scale 0.1 L/min ×
+# 4186 J/(kg·K) × 1 kg/L / 60 s/min
+_THERMAL_COEFF = 0.1 * 4186 / 60
+
+
+@dataclass(frozen=True, kw_only=True)
+class ChiltrixSensorEntityDescription(SensorEntityDescription):
+    """Sensor description with the raw register value multiplier."""
+
+    scale: float = 1.0
+
+
+SENSORS: tuple[ChiltrixSensorEntityDescription, ...] = (
+    # Temperature sensors
+    ChiltrixSensorEntityDescription(
+        key="water_outlet_temp",
+        name="Water Outlet Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ChiltrixSensorEntityDescription(
+        key="inlet_water_temp",
+        name="Inlet Water Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ChiltrixSensorEntityDescription(
+        key="ambient_temp",
+        name="Ambient Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ChiltrixSensorEntityDescription(
+        key="suction_temp",
+        name="Suction Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ChiltrixSensorEntityDescription(
+        key="plate_exchange_temp",
+        name="Plate Exchange Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ChiltrixSensorEntityDescription(
+        key="ipm_temp",
+        name="IPM Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    # Electrical sensors
+    ChiltrixSensorEntityDescription(
+        key="input_voltage",
+        name="Input Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ChiltrixSensorEntityDescription(
+        key="input_current",
+        name="Input Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ChiltrixSensorEntityDescription(
+        key="compressor_current",
+        name="Compressor Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ChiltrixSensorEntityDescription(
+        key="compressor_phase_current",
+        name="Compressor Phase Current",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ChiltrixSensorEntityDescription(
+        key="bus_line_voltage",
+        name="Bus Line Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    # Performance sensors
+    ChiltrixSensorEntityDescription(
+        key="pump_flow",
+        name="Pump Flow Rate",
+        native_unit_of_measurement="L/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        scale=0.1,
+    ),
+    ChiltrixSensorEntityDescription(
+        key="compressor_frequency",
+        name="Compressor Frequency",
+        native_unit_of_measurement=UnitOfFrequency.HERTZ,
+        device_class=SensorDeviceClass.FREQUENCY,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ChiltrixSensorEntityDescription(
+        key="ec_fan_1_speed",
+        name="EC Fan 1 Speed",
+        native_unit_of_measurement="%",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    ChiltrixSensorEntityDescription(
+        key="ec_fan_2_speed",
+        name="EC Fan 2 Speed",
+        native_unit_of_measurement="%",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    # Runtime sensors
+    ChiltrixSensorEntityDescription(
+        key="compressor_run_hours",
+        name="Compressor Run Hours",
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    ChiltrixSensorEntityDescription(
+        key="e_heater_power",
+        name="Electric Heater Power",
+        native_unit_of_measurement="W",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+)
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: ChiltrixConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Chiltrix sensors."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-
-    sensors = [
-        # Temperature sensors
-        ChiltrixSensor(
-            coordinator,
-            entry,
-            "water_outlet_temp",
-            "Water Outlet Temperature",
-            UnitOfTemperature.CELSIUS,
-            SensorDeviceClass.TEMPERATURE,
-            SensorStateClass.MEASUREMENT,
-        ),
-        ChiltrixSensor(
-            coordinator,
-            entry,
-            "inlet_water_temp",
-            "Inlet Water Temperature",
-            UnitOfTemperature.CELSIUS,
-            SensorDeviceClass.TEMPERATURE,
-            SensorStateClass.MEASUREMENT,
-        ),
-        ChiltrixSensor(
-            coordinator,
-            entry,
-            "ambient_temp",
-            "Ambient Temperature",
-            UnitOfTemperature.CELSIUS,
-            SensorDeviceClass.TEMPERATURE,
-            SensorStateClass.MEASUREMENT,
-        ),
-        ChiltrixSensor(
-            coordinator,
-            entry,
-            "suction_temp",
-            "Suction Temperature",
-            UnitOfTemperature.CELSIUS,
-            SensorDeviceClass.TEMPERATURE,
-            SensorStateClass.MEASUREMENT,
-        ),
-        ChiltrixSensor(
-            coordinator,
-            entry,
-            "plate_exchange_temp",
-            "Plate Exchange Temperature",
-            UnitOfTemperature.CELSIUS,
-            SensorDeviceClass.TEMPERATURE,
-            SensorStateClass.MEASUREMENT,
-        ),
-        ChiltrixSensor(
-            coordinator,
-            entry,
-            "ipm_temp",
-            "IPM Temperature",
-            UnitOfTemperature.CELSIUS,
-            SensorDeviceClass.TEMPERATURE,
-            SensorStateClass.MEASUREMENT,
-        ),
-        # Electrical sensors
-        ChiltrixSensor(
-            coordinator,
-            entry,
-            "input_voltage",
-            "Input Voltage",
-            UnitOfElectricPotential.VOLT,
-            SensorDeviceClass.VOLTAGE,
-            SensorStateClass.MEASUREMENT,
-        ),
-        ChiltrixSensor(
-            coordinator,
-            entry,
-            "input_current",
-            "Input Current",
-            UnitOfElectricCurrent.AMPERE,
-            SensorDeviceClass.CURRENT,
-            SensorStateClass.MEASUREMENT,
-        ),
-        ChiltrixSensor(
-            coordinator,
-            entry,
-            "compressor_current",
-            "Compressor Current",
-            UnitOfElectricCurrent.AMPERE,
-            SensorDeviceClass.CURRENT,
-            SensorStateClass.MEASUREMENT,
-        ),
-        ChiltrixSensor(
-            coordinator,
-            entry,
-            "compressor_phase_current",
-            "Compressor Phase Current",
-            UnitOfElectricCurrent.AMPERE,
-            SensorDeviceClass.CURRENT,
-            SensorStateClass.MEASUREMENT,
-        ),
-        ChiltrixSensor(
-            coordinator,
-            entry,
-            "bus_line_voltage",
-            "Bus Line Voltage",
-            UnitOfElectricPotential.VOLT,
-            SensorDeviceClass.VOLTAGE,
-            SensorStateClass.MEASUREMENT,
-        ),
-        # Performance sensors
-        ChiltrixSensor(
-            coordinator,
-            entry,
-            "pump_flow",
-            "Pump Flow Rate",
-            "L/min",
-            None,
-            SensorStateClass.MEASUREMENT,
-            scale=0.1,
-        ),
-        ChiltrixSensor(
-            coordinator,
-            entry,
-            "compressor_frequency",
-            "Compressor Frequency",
-            UnitOfFrequency.HERTZ,
-            SensorDeviceClass.FREQUENCY,
-            SensorStateClass.MEASUREMENT,
-        ),
-        ChiltrixSensor(
-            coordinator,
-            entry,
-            "ec_fan_1_speed",
-            "EC Fan 1 Speed",
-            "%",
-            None,
-            SensorStateClass.MEASUREMENT,
-        ),
-        ChiltrixSensor(
-            coordinator,
-            entry,
-            "ec_fan_2_speed",
-            "EC Fan 2 Speed",
-            "%",
-            None,
-            SensorStateClass.MEASUREMENT,
-        ),
-        # Runtime sensors
-        ChiltrixSensor(
-            coordinator,
-            entry,
-            "compressor_run_hours",
-            "Compressor Run Hours",
-            UnitOfTime.HOURS,
-            SensorDeviceClass.DURATION,
-            SensorStateClass.TOTAL_INCREASING,
-        ),
-        ChiltrixSensor(
-            coordinator,
-            entry,
-            "e_heater_power",
-            "Electric Heater Power",
-            "W",
-            SensorDeviceClass.POWER,
-            SensorStateClass.MEASUREMENT,
-        ),
-    ]
+    runtime = entry.runtime_data
+    coordinator = runtime.coordinator
 
-    # Add COP sensor (calculated)
-    sensors.append(ChiltrixCOPSensor(coordinator, entry))
+    async_add_entities(_build_sensors(coordinator, entry, runtime.device_info))
 
-    async_add_entities(sensors)
 
+def _build_sensors(
+    coordinator, entry: ConfigEntry, device_info: DeviceInfo
+) -> Iterator[SensorEntity]:
+    """Yield the register sensors followed by the calculated COP sensor."""
+    for description in SENSORS:
+        yield ChiltrixSensor(coordinator, entry, device_info, description)
+
+    # Add COP sensor (calculated)
+    yield ChiltrixCOPSensor(coordinator, entry, device_info)
 
-class ChiltrixSensor(CoordinatorEntity, SensorEntity):
+
+class ChiltrixSensor(ChiltrixEntity, SensorEntity):
     """Chiltrix sensor entity."""
 
+    __slots__ = ("_scale", "_scale_is_one")
+
     def __init__(
         self,
         coordinator,
         entry: ConfigEntry,
-        data_key: str,
-        name: str,
-        unit: str | None,
-        device_class: SensorDeviceClass | None,
-        state_class: SensorStateClass | None,
-        scale: float = 1.0,
+        device_info: DeviceInfo,
+        description: ChiltrixSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._data_key = data_key
-        self._scale = scale
-        self._attr_name = f"Chiltrix {name}"
-        self._attr_unique_id = f"{entry.entry_id}_{data_key}"
-        self._attr_native_unit_of_measurement = unit
-        self._attr_device_class = device_class
-        self._attr_state_class = state_class
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Chiltrix CX50-2 Heat Pump",
-            "manufacturer": "Chiltrix",
-            "model": "CX50-2",
-        }
+        super().__init__(
+            coordinator, entry, device_info, description.key, description.name
+        )
+        self.entity_description = description
+        self._scale = description.scale
+        self._scale_is_one = description.scale == 1.0
+        self._set_state_from(coordinator.data.get(self._data_key))
 
-    @property
-    def native_value(self) -> float | int | None:
-        """Return the state of the sensor."""
-        value = self.coordinator.data.get(self._data_key)
-        if value is None:
-            return None
-        return value * self._scale
+    def _set_state_from(self, value: float | int | None) -> None:
+        """Scale the raw value once per change.
+
+        SensorEntity then serves native_value from _attr_native_value instead
+        of re-reading coordinator data on every state read.
+        """
+        # Unscaled registers keep their int value instead of becoming floats
+        if value is None or self._scale_is_one:
+            self._attr_native_value = value
+        else:
+            self._attr_native_value = value * self._scale
 
 
 class ChiltrixCOPSensor(CoordinatorEntity, SensorEntity):
     """Chiltrix COP (Coefficient of Performance) sensor."""
 
-    def __init__(self, coordinator, entry: ConfigEntry) -> None:
+    __slots__ = ()
+
+    def __init__(
+        self, coordinator, entry: ConfigEntry, device_info: DeviceInfo
+    ) -> None:
         """Initialize the COP sensor."""
         super().__init__(coordinator)
         self._attr_name = "Chiltrix COP"
@@ -249,12 +238,7 @@ class ChiltrixCOPSensor(CoordinatorEntity, SensorEntity):
         self._attr_device_class = None
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_icon = "mdi:gauge"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Chiltrix CX50-2 Heat Pump",
-            "manufacturer": "Chiltrix",
-            "model": "CX50-2",
-        }
+        self._attr_device_info = device_info
 
     @property
     def native_value(self) -> float | None:
@@ -263,38 +247,38 @@ class ChiltrixCOPSensor(CoordinatorEntity, SensorEntity):
         # Thermal Power (W) = Flow Rate (L/min) × Specific Heat (4.186 kJ/kg·K) × Temp Difference (K) × Density (kg/L)
         # For water: Thermal Power (W) = Flow Rate (L/min) × 4.186 × ΔT × (1000/60) = Flow × 69.77 × ΔT
 
-        flow_rate = self.coordinator.data.get("pump_flow")  # Raw value, needs 0.1 scale
-        inlet_temp = self.coordinator.data.get("inlet_water_temp")
-        outlet_temp = self.coordinator.data.get("water_outlet_temp")
-        input_voltage = self.coordinator.data.get("input_voltage")
-        input_current = self.coordinator.data.get("input_current")
+        data = self.coordinator.data
+        flow_rate = data.get("pump_flow")  # Raw value, needs 0.1 scale
+        inlet_temp = data.get("inlet_water_temp")
+        outlet_temp = data.get("water_outlet_temp")
+        input_voltage = data.get("input_voltage")
+        input_current = data.get("input_current")
 
-        if None in (flow_rate, inlet_temp, outlet_temp, input_voltage, input_current):
+        if (
+            flow_rate is None
+            or inlet_temp is None
+            or outlet_temp is None
+            or input_voltage is None
+            or input_current is None
+        ):
             return None
 
-        # Avoid division by zero
-        if input_voltage == 0 or input_current == 0:
-            return None
-
-        # Calculate values
-        flow_lpm = flow_rate * 0.1  # Scale flow rate
-        temp_diff = abs(outlet_temp - inlet_temp)
-
-        # Thermal power in watts
-        # Flow (L/min) × 4186 (J/kg·K) × ΔT (K) × (1 kg/L) / 60 (s/min)
-        thermal_power = flow_lpm * 4186 * temp_diff / 60
-
         # Electrical power in watts
         electrical_power = input_voltage * input_current
 
-        # Avoid division by zero and unrealistic values
+        # Avoid division by zero and unrealistic values; a zero voltage or
+        # current also lands here
         if electrical_power < 10:  # Less than 10W doesn't make sense
             return None
 
+        # Thermal power in watts
+        thermal_power = flow_rate * abs(outlet_temp - inlet_temp) * _THERMAL_COEFF
+
         cop = thermal_power / electrical_power
 
         # Sanity check: COP should be between 0.5 and 10 for a heat pump
         if 0.5 <= cop <= 10:
-            return round(cop, 2)
+            # cop is positive here, so adding 0.5 before truncating rounds half up
+            return int(cop * 100 + 0.5) / 100
 
         return None
@@ -1,104 +1,130 @@
 """Switch platform for Chiltrix CX50-2."""
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from functools import partial
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from . import ChiltrixConfigEntry
+from .const import REGISTER_POWER_CONTROL
+from .entity import ChiltrixEntity
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: ChiltrixConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Chiltrix switches."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    client = hass.data[DOMAIN][entry.entry_id]["client"]
+    runtime = entry.runtime_data
+    coordinator = runtime.coordinator
+    client = runtime.client
+    device_info = runtime.device_info
 
+    # DHW priority and silent mode map to unverified coils, so they have no
+    # control yet and stay unavailable
     entities = [
-        ChiltrixSwitch(
+        ChiltrixPowerSwitch(
             coordinator,
-            client,
             entry,
+            device_info,
             "power",
             "Power",
             "mdi:power",
-            "set_power",
+            partial(client.write_register, REGISTER_POWER_CONTROL),
         ),
         ChiltrixSwitch(
             coordinator,
-            client,
             entry,
+            device_info,
             "dhw_mode_active",
             "DHW Priority Mode",
             "mdi:water-boiler",
-            "set_dhw_mode",
+            None,
         ),
         ChiltrixSwitch(
             coordinator,
-            client,
             entry,
+            device_info,
             "silent_mode",
             "Silent Mode",
             "mdi:volume-off",
-            "set_silent_mode",
+            None,
         ),
     ]
 
     async_add_entities(entities)
 
 
-class ChiltrixSwitch(CoordinatorEntity, SwitchEntity):
-    """Chiltrix switch entity."""
+class ChiltrixSwitch(ChiltrixEntity, SwitchEntity):
+    """Chiltrix switch entity.
+
+    Switches without a control (no verified register or coil yet) are
+    unavailable and refuse writes.
+    """
+
+    __slots__ = ("_control",)
 
     def __init__(
         self,
         coordinator,
-        client,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
         data_key: str,
         name: str,
         icon: str,
-        control_method: str,
+        control: Callable[[int], Awaitable[bool]] | None,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
-        self._client = client
-        self._data_key = data_key
-        self._control_method = control_method
-        self._attr_name = f"Chiltrix {name}"
-        self._attr_unique_id = f"{entry.entry_id}_{data_key}_switch"
+        super().__init__(coordinator, entry, device_info, data_key, name, "_switch")
+        # Write for this switch's register or coil, bound once in setup
+        self._control = control
         self._attr_icon = icon
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Chiltrix CX50-2 Heat Pump",
-            "manufacturer": "Chiltrix",
-            "model": "CX50-2",
-        }
+        self._set_state_from(coordinator.data.get(data_key))
+
+    def _set_state_from(self, value: bool | int | None) -> None:
+        """Set the on state from the data value."""
+        self._attr_is_on = value
 
     @property
-    def is_on(self) -> bool | None:
-        """Return true if the switch is on."""
-        return self.coordinator.data.get(self._data_key)
+    def available(self) -> bool:
+        """Return True only for switches with a verified control."""
+        return self._control is not None and super().available
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
-        method = getattr(self._client, self._control_method)
-        success = await self.hass.async_add_executor_job(method, True)
-        
-        if success:
-            await self.coordinator.async_request_refresh()
+        await self._async_set_state(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
-        method = getattr(self._client, self._control_method)
-        success = await self.hass.async_add_executor_job(method, False)
-        
-        if success:
-            await self.coordinator.async_request_refresh()
+        await self._async_set_state(False)
+
+    async def _async_set_state(self, on: bool) -> None:
+        """Write the coil and publish the new state optimistically."""
+        if self._control is None:
+            raise HomeAssistantError(
+                f"The CX50 control for {self.name} is not verified yet"
+            )
+        if await self._control(on):
+            self.coordinator.async_set_values({self._data_key: on})
+
+
+class ChiltrixPowerSwitch(ChiltrixSwitch):
+    """Power switch backed by holding register 140."""
+
+    __slots__ = ()
+
+    async def _async_set_state(self, on: bool) -> None:
+        """Write the register as 0/1 and publish it like the climate entity."""
+        value = int(on)
+        if await self._control(value):
+            self.coordinator.async_set_register_values(
+                {REGISTER_POWER_CONTROL: value}
+            )